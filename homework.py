@@ -1,29 +1,34 @@
-from typing import Union, Dict, Tuple, List, Type
-from dataclasses import dataclass
+from __future__ import annotations
+
+from typing import Optional, Union, Dict, Tuple, List, Sequence, Type
 
 
-@dataclass
 class InfoMessage:
     """Информационное сообщение о тренировке."""
 
-    training_type: str
-    duration: float
-    distance: float
-    speed: float
-    calories: float
-    message: str = (
-        "Тип тренировки: {}; "
-        "Длительность: {:.3f} ч.; "
-        "Дистанция: {:.3f} км; "
-        "Ср. скорость: {:.3f} км/ч; "
-        "Потрачено ккал: {:.3f}."
-    )
+    __slots__ = ('training_type', 'duration', 'distance', 'speed', 'calories')
+
+    def __init__(self,
+                 training_type: str,
+                 duration: float,
+                 distance: float,
+                 speed: float,
+                 calories: float,
+                 ) -> None:
+        self.training_type: str = training_type
+        self.duration: float = duration
+        self.distance: float = distance
+        self.speed: float = speed
+        self.calories: float = calories
 
     def get_message(self) -> str:
         """Вывод информации о тренировке."""
-        return self.message.format(
-            self.training_type, self.duration,
-            self.distance, self.speed, self.calories,
+        return (
+            f"Тип тренировки: {self.training_type}; "
+            f"Длительность: {self.duration:.3f} ч.; "
+            f"Дистанция: {self.distance:.3f} км; "
+            f"Ср. скорость: {self.speed:.3f} км/ч; "
+            f"Потрачено ккал: {self.calories:.3f}."
         )
 
 
@@ -33,11 +38,18 @@ class Training:
     LEN_STEP: float = 0.65
     M_IN_KM: int = 1000
     MIN_IN_HOUR: int = 60
+    TYPE_NAME: str = 'Training'
+
+    def __init_subclass__(cls, **kwargs) -> None:
+        super().__init_subclass__(**kwargs)
+        if 'TYPE_NAME' not in cls.__dict__:
+            cls.TYPE_NAME = cls.__name__
 
     def __init__(self,
                  action: int,
                  duration: float,
                  weight: float,
+                 /,
                  ) -> None:
         self.action: int = action
         self.duration_hour: float = duration
@@ -59,15 +71,36 @@ class Training:
             "Для тренировки не определен метод подсчета калорий."
         )
 
-    def show_training_info(self) -> InfoMessage:
-        """Вернуть информационное сообщение о выполненной тренировке."""
-        return InfoMessage(
-            self.__class__.__name__,
-            self.duration_hour,
-            self.get_distance(),
-            self.get_mean_speed(),
-            self.get_spent_calories()
-        )
+    def _compute(self) -> Tuple[float, float, float]:
+        """Получить дистанцию, среднюю скорость и калории тренировки."""
+        distance: float = self.get_distance()
+        speed: float = self.get_mean_speed()
+        calories: float = self.get_spent_calories()
+        return distance, speed, calories
+
+    def show_training_info(self,
+                           info: Optional[InfoMessage] = None,
+                           ) -> InfoMessage:
+        """Вернуть информационное сообщение о выполненной тренировке.
+
+        Если передан объект `info`, он заполняется данными тренировки
+        и возвращается вместо создания нового сообщения.
+        """
+        distance, speed, calories = self._compute()
+        if info is None:
+            return InfoMessage(
+                self.TYPE_NAME,
+                self.duration_hour,
+                distance,
+                speed,
+                calories,
+            )
+        info.training_type = self.TYPE_NAME
+        info.duration = self.duration_hour
+        info.distance = distance
+        info.speed = speed
+        info.calories = calories
+        return info
 
 
 class Running(Training):
@@ -78,8 +111,9 @@ class Running(Training):
 
     def get_spent_calories(self) -> float:
         """Получить количество затраченных калорий."""
+        speed: float = self.get_mean_speed()
         calories: float = (
-            (self.COEFF_CALORIE_1 * self.get_mean_speed()
+            (self.COEFF_CALORIE_1 * speed
              - self.COEFF_CALORIE_2)
             * self.weight / self.M_IN_KM
             * self.MIN_IN_HOUR * self.duration_hour
@@ -98,16 +132,19 @@ class SportsWalking(Training):
                  duration: float,
                  weight: float,
                  height: float,
+                 /,
                  ) -> None:
         super().__init__(action, duration, weight,)
         self.height: float = height
 
     def get_spent_calories(self) -> float:
         """Получить количество затраченных калорий."""
+        speed: float = self.get_mean_speed()
+        weight: float = self.weight
         calories: float = (
-            (self.COEFF_CALORIE_1 * self.weight
-             + (self.get_mean_speed() ** 2 // self.height)
-             * self.COEFF_CALORIE_2 * self.weight)
+            (self.COEFF_CALORIE_1 * weight
+             + (speed * speed // self.height)
+             * self.COEFF_CALORIE_2 * weight)
             * self.MIN_IN_HOUR * self.duration_hour
         )
         return calories
@@ -126,6 +163,7 @@ class Swimming(Training):
                  weight: float,
                  length_pool: float,
                  count_pool: int,
+                 /,
                  ) -> None:
         super().__init__(action, duration, weight,)
         self.length_pool: float = length_pool
@@ -141,24 +179,53 @@ class Swimming(Training):
 
     def get_spent_calories(self) -> float:
         """Получить количество затраченных калорий."""
+        speed: float = self.get_mean_speed()
         calories: float = (
-            (self.get_mean_speed() + self.COEFF_CALORIE_1)
+            (speed + self.COEFF_CALORIE_1)
             * self.COEFF_CALORIE_2 * self.weight
         )
         return calories
 
 
-def read_package(workout_type: str, data: list) -> Training:
+WORKOUT_CLASSES: Tuple[Type[Training], ...] = (
+    Swimming, Running, SportsWalking,
+)
+WORKOUT_TYPES: Dict[str, Type[Training]] = {
+    "SWM": Swimming, "RUN": Running, "WLK": SportsWalking,
+}
+
+
+def read_package(workout_type: Union[str, int],
+                 data: Sequence[Union[int, float]],
+                 ) -> Training:
     """Прочитать данные полученные от датчиков."""
-    workout_types: Dict[str, Type[Training]] = {
-        "SWM": Swimming, "RUN": Running, "WLK": SportsWalking,
-    }
-    if workout_type in workout_types:
-        training: Training = workout_types[workout_type](*data)
-        return training
-    raise ValueError(
-        "Некорректный код тренировки или данные от датчиков устройств."
-    )
+    training_class: Optional[Type[Training]]
+    if (isinstance(workout_type, int)
+            and not isinstance(workout_type, bool)):
+        training_class = (
+            WORKOUT_CLASSES[workout_type]
+            if 0 <= workout_type < len(WORKOUT_CLASSES) else None
+        )
+    else:
+        training_class = WORKOUT_TYPES.get(workout_type)
+    if training_class is None:
+        raise ValueError(
+            "Некорректный код тренировки или данные от датчиков устройств."
+        )
+    training: Training = training_class(*data)
+    return training
+
+
+def run_batch(packages: List[Tuple[Union[str, int],
+                                   Sequence[Union[int, float]]]],
+              ) -> List[str]:
+    """Обработать пакет данных от датчиков и вернуть список сообщений."""
+    info: InfoMessage = InfoMessage("", 0.0, 0.0, 0.0, 0.0)
+    return [
+        read_package(workout_type, data).show_training_info(info)
+        .get_message()
+        for workout_type, data in packages
+    ]
 
 
 def main(training: Training) -> None:
@@ -169,7 +236,7 @@ def main(training: Training) -> None:
 
 
 if __name__ == '__main__':
-    packages: List[Tuple[str, List[Union[int, float]]]] = [
+    packages: List[Tuple[str, Sequence[Union[int, float]]]] = [
         ('SWM', [720, 1, 80, 25, 40]),
         ('RUN', [15000, 1, 75]),
         ('WLK', [9000, 1, 75, 180]),
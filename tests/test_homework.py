@@ -1,4 +1,5 @@
 import re
+import enum
 import pytest
 import types
 import inspect
@@ -41,6 +42,32 @@ def test_read_package_return(input_data, expected):
     )
 
 
+class WorkoutCode(enum.IntEnum):
+    SWM = 0
+    RUN = 1
+    WLK = 2
+
+
+@pytest.mark.parametrize('input_data, expected', [
+    ((0, [720, 1, 80, 25, 40]), 'Swimming'),
+    ((1, [15000, 1, 75]), 'Running'),
+    ((2, [9000, 1, 75, 180]), 'SportsWalking'),
+    ((WorkoutCode.RUN, [15000, 1, 75]), 'Running'),
+])
+def test_read_package_int_code(input_data, expected):
+    result = homework.read_package(*input_data)
+    assert result.__class__.__name__ == expected, (
+        'Функция `read_package` должна принимать числовой код тренировки '
+        '- индекс класса в `WORKOUT_CLASSES`.'
+    )
+
+
+@pytest.mark.parametrize('workout_type', [True, 3, -1])
+def test_read_package_invalid_int_code(workout_type):
+    with pytest.raises(ValueError):
+        homework.read_package(workout_type, [15000, 1, 75])
+
+
 def test_InfoMessage():
     assert inspect.isclass(homework.InfoMessage), (
         'Проверьте, что `InfoMessage` - это класс.'
@@ -205,6 +232,39 @@ def test_Training_show_training_info(monkeypatch):
     )
 
 
+def test_Running_show_training_info_uses_overridden_calories(monkeypatch):
+    running = homework.Running(*[9000, 1, 75])
+
+    def mock_get_spent_calories():
+        return 100
+    monkeypatch.setattr(
+        running,
+        'get_spent_calories',
+        mock_get_spent_calories
+    )
+    result = running.show_training_info()
+    assert result.calories == 100, (
+        'Метод `show_training_info` должен использовать '
+        'переопределённый метод `get_spent_calories`.'
+    )
+
+
+def test_Training_show_training_info_reuses_message():
+    info = homework.InfoMessage('', 0.0, 0.0, 0.0, 0.0)
+    running = homework.Running(*[9000, 1, 75])
+    result = running.show_training_info(info)
+    assert result is info, (
+        'Метод `show_training_info` должен заполнять и возвращать '
+        'переданный объект `InfoMessage`.'
+    )
+    assert result.get_message() == (
+        running.show_training_info().get_message()
+    ), (
+        'Переданный объект `InfoMessage` должен содержать '
+        'данные тренировки.'
+    )
+
+
 def test_Swimming():
     assert hasattr(homework, 'Swimming'), 'Создайте класс `Swimming`'
     assert inspect.isclass(homework.Swimming), (
@@ -363,3 +423,64 @@ def test_main_output(input_data, expected):
     assert get_message_output == expected, (
         'Метод `main` должен печатать результат в консоль.\n'
     )
+
+
+@pytest.mark.parametrize('packages, expected', [
+    ([('SWM', [720, 1, 80, 25, 40])], [
+        'Тип тренировки: Swimming; '
+        'Длительность: 1.000 ч.; '
+        'Дистанция: 0.994 км; '
+        'Ср. скорость: 1.000 км/ч; '
+        'Потрачено ккал: 336.000.'
+    ]),
+    ([('RUN', [15000, 1, 75])], [
+        'Тип тренировки: Running; '
+        'Длительность: 1.000 ч.; '
+        'Дистанция: 9.750 км; '
+        'Ср. скорость: 9.750 км/ч; '
+        'Потрачено ккал: 699.750.'
+    ]),
+    ([('WLK', [9000, 1, 75, 180])], [
+        'Тип тренировки: SportsWalking; '
+        'Длительность: 1.000 ч.; '
+        'Дистанция: 5.850 км; '
+        'Ср. скорость: 5.850 км/ч; '
+        'Потрачено ккал: 157.500.'
+    ]),
+    ([
+        ('SWM', [720, 1, 80, 25, 40]),
+        ('RUN', [15000, 1, 75]),
+        ('WLK', [9000, 1, 75, 180]),
+        ('RUN', [15000, 1, 75]),
+    ], [
+        'Тип тренировки: Swimming; '
+        'Длительность: 1.000 ч.; '
+        'Дистанция: 0.994 км; '
+        'Ср. скорость: 1.000 км/ч; '
+        'Потрачено ккал: 336.000.',
+        'Тип тренировки: Running; '
+        'Длительность: 1.000 ч.; '
+        'Дистанция: 9.750 км; '
+        'Ср. скорость: 9.750 км/ч; '
+        'Потрачено ккал: 699.750.',
+        'Тип тренировки: SportsWalking; '
+        'Длительность: 1.000 ч.; '
+        'Дистанция: 5.850 км; '
+        'Ср. скорость: 5.850 км/ч; '
+        'Потрачено ккал: 157.500.',
+        'Тип тренировки: Running; '
+        'Длительность: 1.000 ч.; '
+        'Дистанция: 9.750 км; '
+        'Ср. скорость: 9.750 км/ч; '
+        'Потрачено ккал: 699.750.'
+    ]),
+])
+def test_run_batch(packages, expected):
+    assert hasattr(homework, 'run_batch'), (
+        'Создайте функцию `run_batch` для обработки списка пакетов.'
+    )
+    result = homework.run_batch(packages)
+    assert result == expected, (
+        'Функция `run_batch` должна возвращать список сообщений '
+        'для всех тренировок пакета в исходном порядке.'
+    )